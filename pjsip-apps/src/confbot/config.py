@@ -38,4 +38,4 @@ ua_cfg.stun_host = "stun.pjsip.org"
 # Media config (you can also set it to None to use default values)
 media_cfg = pj.MediaConfig()
 media_cfg.enable_ice = True
-media_cfg.max_calls = 20
+ua_cfg.max_calls = 20
@@ -57,14 +57,51 @@ tutorial. The paragraphs below explain basic tasks on using this module.
 
 """
 import _pjsua
-import thread
 import threading
 import weakref
 import time
 
-class Error:
+# Module-level binding of the native URI parser; SIPUri.decode runs on
+# the call setup path and this saves the attribute lookup per parse.
+_parse_simple_uri = _pjsua.parse_simple_uri
+
+# Frequently used _pjsua entry points, bound once at import so the
+# conversion helpers do a single fast local/global load instead of a
+# module attribute lookup per call.
+_logging_config_default = _pjsua.logging_config_default
+_media_config_default = _pjsua.media_config_default
+_acc_config_default = _pjsua.acc_config_default
+_transport_get_info = _pjsua.transport_get_info
+_Pjsip_Cred_Info = _pjsua.Pjsip_Cred_Info
+_acc_get_info = _pjsua.acc_get_info
+_call_get_info = _pjsua.call_get_info
+_call_answer = _pjsua.call_answer
+_call_hangup = _pjsua.call_hangup
+_call_dial_dtmf = _pjsua.call_dial_dtmf
+_buddy_get_info = _pjsua.buddy_get_info
+_im_send = _pjsua.im_send
+_im_typing = _pjsua.im_typing
+
+# Per-thread scratch storage; SIPUri.encode reuses one parts list per
+# thread instead of allocating a fresh list for every encoded URI.
+_tls = threading.local()
+
+def _uri_parts_buf():
+    buf = getattr(_tls, 'uri_parts', None)
+    if buf is None:
+        buf = _tls.uri_parts = []
+    else:
+        del buf[:]
+    return buf
+
+# Cache of error code -> description, so repeated failures with the
+# same code (e.g. registration retries) only format the message once.
+_STRERROR_CACHE = {}
+
+
+class Error(Exception):
     """Error exception class.
-    
+
     Member documentation:
 
     op_name  -- name of the operation that generated this error.
@@ -72,27 +109,29 @@ class Error:
     err_code -- the error code.
 
     """
-    op_name = ""
-    obj = None
-    err_code = -1
-    _err_msg = ""
+    __slots__ = ('op_name', 'obj', 'err_code', '_err_msg', '_str')
 
-    def __init__(self, op_name, obj, err_code, err_msg=""):
+    def __init__(self, op_name, obj, err_code, err_msg=None):
         self.op_name = op_name
         self.obj = obj
         self.err_code = err_code
         self._err_msg = err_msg
+        self._str = None
 
     def err_msg(self):
         "Retrieve the description of the error."
-        if self._err_msg != "":
+        if self._err_msg is not None:
             return self._err_msg
         self._err_msg = Lib.strerror(self.err_code)
         return self._err_msg
 
     def __str__(self):
-        return "Object: " + str(self.obj) + ", operation=" + self.op_name + \
-               ", error=" + self.err_msg()
+        if self._str is None:
+            self._str = "Object: %s, operation=%s, error=%s" % \
+                        (self.obj, self.op_name, self.err_msg())
+        return self._str
+
+    __repr__ = __str__
 
 # 
 # Constants
@@ -241,9 +280,38 @@ class TURNConnType:
     TLS = 255
 
 
-class UAConfig:
+def _gen_cvt_to_pjsua(default_factory, fields):
+    """Generate a straight-line _cvt_to_pjsua method at import time.
+
+    The config classes copy their attributes one by one into the _pjsua
+    config object. Generating the copier once from the field list keeps
+    each conversion a flat run of assignments without any per-call
+    loop or name lookup overhead.
+
+    Keyword arguments:
+    default_factory -- name of the _pjsua *_default() factory.
+    fields          -- sequence of field names; a plain name copies
+                       self.<name> into cfg.<name>, while a (name, expr)
+                       pair assigns the given expression to cfg.<name>.
+
+    """
+    lines = ["def _cvt_to_pjsua(self):",
+             "    cfg = _default()"]
+    for f in fields:
+        if isinstance(f, tuple):
+            dst, src = f
+        else:
+            dst, src = f, "self." + f
+        lines.append("    cfg.%s = %s" % (dst, src))
+    lines.append("    return cfg")
+    ns = {'_default': getattr(_pjsua, default_factory)}
+    exec "\n".join(lines) in ns
+    return ns['_cvt_to_pjsua']
+
+
+class UAConfig(object):
     """User agent configuration to be specified in Lib.init().
-    
+
     Member documentation:
 
     max_calls   -- maximum number of calls to be supported.
@@ -255,12 +323,17 @@ class UAConfig:
                    also be used if DNS SRV resolution for stun_domain fails.
     user_agent  -- Optionally specify the user agent name.
     """
-    max_calls = 4
-    nameserver = []
-    stun_domain = ""
-    stun_host = ""
-    user_agent = "pjsip python"
-    
+    __slots__ = ('max_calls', 'thread_cnt', 'nameserver', 'stun_domain',
+                 'stun_host', 'user_agent')
+
+    def __init__(self):
+        self.max_calls = 4
+        self.thread_cnt = 0
+        self.nameserver = []
+        self.stun_domain = ""
+        self.stun_host = ""
+        self.user_agent = "pjsip python"
+
     def _cvt_from_pjsua(self, cfg):
         self.max_calls = cfg.max_calls
         self.thread_cnt = cfg.thread_cnt
@@ -269,18 +342,12 @@ class UAConfig:
         self.stun_host = cfg.stun_host
         self.user_agent = cfg.user_agent
 
-    def _cvt_to_pjsua(self):
-        cfg = _pjsua.config_default()
-        cfg.max_calls = self.max_calls
-        cfg.thread_cnt = 0
-        cfg.nameserver = self.nameserver
-        cfg.stun_domain = self.stun_domain
-        cfg.stun_host = self.stun_host
-        cfg.user_agent = self.user_agent
-        return cfg
+    _cvt_to_pjsua = _gen_cvt_to_pjsua('config_default',
+        ('max_calls', ('thread_cnt', '0'), 'nameserver', 'stun_domain',
+         'stun_host', 'user_agent'))
 
 
-class LogConfig:
+class LogConfig(object):
     """Logging configuration to be specified in Lib.init().
     
     Member documentation:
@@ -298,16 +365,12 @@ class LogConfig:
                         print str,
 
     """
-    msg_logging = True
-    level = 5
-    console_level = 5
-    decor = 0
-    filename = ""
-    callback = None
-    
+    __slots__ = ('msg_logging', 'level', 'console_level', 'decor',
+                 'filename', 'callback')
+
     def __init__(self, level=-1, filename="", callback=None,
                  console_level=-1):
-        self._cvt_from_pjsua(_pjsua.logging_config_default())
+        self._cvt_from_pjsua(_logging_config_default())
         if level != -1:
             self.level = level
         if filename != "":
@@ -325,18 +388,12 @@ class LogConfig:
         self.filename = cfg.log_filename
         self.callback = cfg.cb
 
-    def _cvt_to_pjsua(self):
-        cfg = _pjsua.logging_config_default()
-        cfg.msg_logging = self.msg_logging
-        cfg.level = self.level
-        cfg.console_level = self.console_level
-        cfg.decor = self.decor
-        cfg.log_filename = self.filename
-        cfg.cb = self.callback
-        return cfg
+    _cvt_to_pjsua = _gen_cvt_to_pjsua('logging_config_default',
+        ('msg_logging', 'level', 'console_level', 'decor',
+         ('log_filename', 'self.filename'), ('cb', 'self.callback')))
 
 
-class MediaConfig:
+class MediaConfig(object):
     """Media configuration to be specified in Lib.init().
     
     Member documentation:
@@ -379,30 +436,15 @@ class MediaConfig:
                            the TURNConnType constant.
     turn_cred           -- specify AuthCred for the TURN credential.
     """
-    clock_rate = 16000
-    snd_clock_rate = 0
-    snd_auto_close_time = 5
-    channel_count = 1
-    audio_frame_ptime = 20
-    max_media_ports = 32
-    quality = 6
-    ptime = 0
-    no_vad = False
-    ilbc_mode = 30
-    tx_drop_pct = 0
-    rx_drop_pct = 0
-    ec_options = 0
-    ec_tail_len = 256
-    jb_min = -1
-    jb_max = -1
-    enable_ice = True
-    enable_turn = False
-    turn_server = ""
-    turn_conn_type = TURNConnType.UDP
-    turn_cred = None
-     
+    __slots__ = ('clock_rate', 'snd_clock_rate', 'snd_auto_close_time',
+                 'channel_count', 'audio_frame_ptime', 'max_media_ports',
+                 'quality', 'ptime', 'no_vad', 'ilbc_mode', 'tx_drop_pct',
+                 'rx_drop_pct', 'ec_options', 'ec_tail_len', 'jb_min',
+                 'jb_max', 'enable_ice', 'enable_turn', 'turn_server',
+                 'turn_conn_type', 'turn_cred')
+
     def __init__(self):
-        default = _pjsua.media_config_default()
+        default = _media_config_default()
         self._cvt_from_pjsua(default)
 
     def _cvt_from_pjsua(self, cfg):
@@ -432,28 +474,15 @@ class MediaConfig:
         else:
             self.turn_cred = None
 
+    _cvt_flat = _gen_cvt_to_pjsua('media_config_default',
+        ('clock_rate', 'snd_clock_rate', 'snd_auto_close_time',
+         'channel_count', 'audio_frame_ptime', 'max_media_ports',
+         'quality', 'ptime', 'no_vad', 'ilbc_mode', 'tx_drop_pct',
+         'rx_drop_pct', 'ec_options', 'ec_tail_len', 'jb_min', 'jb_max',
+         'enable_ice', 'enable_turn', 'turn_server', 'turn_conn_type'))
+
     def _cvt_to_pjsua(self):
-        cfg = _pjsua.media_config_default()
-        cfg.clock_rate = self.clock_rate
-        cfg.snd_clock_rate = self.snd_clock_rate
-        cfg.snd_auto_close_time = self.snd_auto_close_time
-        cfg.channel_count = self.channel_count
-        cfg.audio_frame_ptime = self.audio_frame_ptime
-        cfg.max_media_ports = self.max_media_ports
-        cfg.quality = self.quality
-        cfg.ptime = self.ptime
-        cfg.no_vad = self.no_vad
-        cfg.ilbc_mode = self.ilbc_mode
-        cfg.tx_drop_pct = self.tx_drop_pct
-        cfg.rx_drop_pct = self.rx_drop_pct
-        cfg.ec_options = self.ec_options
-        cfg.ec_tail_len = self.ec_tail_len
-        cfg.jb_min = self.jb_min
-        cfg.jb_max = self.jb_max
-        cfg.enable_ice = self.enable_ice
-        cfg.enable_turn = self.enable_turn
-        cfg.turn_server = self.turn_server
-        cfg.turn_conn_type = self.turn_conn_type
+        cfg = self._cvt_flat()
         if self.turn_cred:
             cfg.turn_realm = self.turn_cred.realm
             cfg.turn_username = self.turn_cred.username
@@ -462,7 +491,7 @@ class MediaConfig:
         return cfg
 
 
-class TransportConfig:
+class TransportConfig(object):
     """SIP transport configuration class.
     
     Member configuration:
@@ -500,23 +529,20 @@ class TransportConfig:
                               2: PJ_QOS_WMM_PRIO_VIDEO: Video priority
                               3: PJ_QOS_WMM_PRIO_VOICE: Voice priority.
     """
-    port = 0
-    bound_addr = ""
-    public_addr = ""
-    
-    qos_type = 0
-    qos_params_flags = 0
-    qos_params_dscp_val = 0
-    qos_params_so_prio = 0
-    qos_params_wmm_prio = 0
-    
-    
+    __slots__ = ('port', 'bound_addr', 'public_addr', 'qos_type',
+                 'qos_params_flags', 'qos_params_dscp_val',
+                 'qos_params_so_prio', 'qos_params_wmm_prio')
 
-    def __init__(self, port=0, 
+    def __init__(self, port=0,
                  bound_addr="", public_addr=""):
         self.port = port
         self.bound_addr = bound_addr
         self.public_addr = public_addr
+        self.qos_type = 0
+        self.qos_params_flags = 0
+        self.qos_params_dscp_val = 0
+        self.qos_params_so_prio = 0
+        self.qos_params_wmm_prio = 0
 
     def _cvt_from_pjsua(self, cfg):
         self.port = cfg.port
@@ -528,21 +554,13 @@ class TransportConfig:
         self.qos_params_so_prio = cfg.qos_params_so_prio
         self.qos_params_wmm_prio = cfg.qos_params_wmm_prio
 
-    def _cvt_to_pjsua(self):
-        cfg = _pjsua.transport_config_default()
-        cfg.port = self.port
-        cfg.bound_addr = self.bound_addr
-        cfg.public_addr = self.public_addr
-        cfg.qos_type = self.qos_type
-        cfg.qos_params_flags = self.qos_params_flags
-        cfg.qos_params_dscp_val = self.qos_params_dscp_val
-        cfg.qos_params_so_prio = self.qos_params_so_prio
-        cfg.qos_params_wmm_prio = self.qos_params_wmm_prio
-
-        return cfg
+    _cvt_to_pjsua = _gen_cvt_to_pjsua('transport_config_default',
+        ('port', 'bound_addr', 'public_addr', 'qos_type',
+         'qos_params_flags', 'qos_params_dscp_val', 'qos_params_so_prio',
+         'qos_params_wmm_prio'))
 
 
-class TransportInfo:
+class TransportInfo(object):
     """SIP transport info.
     
     Member documentation:
@@ -556,21 +574,15 @@ class TransportInfo:
     port        -- the port number.
     ref_cnt     -- number of objects referencing this transport.
     """
-    type = ""
-    description = ""
-    is_reliable = False
-    is_secure = False
-    is_datagram = False
-    host = ""
-    port = 0
-    ref_cnt = 0
-    
+    __slots__ = ('type', 'description', 'is_reliable', 'is_secure',
+                 'is_datagram', 'host', 'port', 'ref_cnt')
+
     def __init__(self, ti):
         self.type = ti.type_name
         self.description = ti.info
-        self.is_reliable = (ti.flag & TransportFlag.RELIABLE)
-        self.is_secure = (ti.flag & TransportFlag.SECURE)
-        self.is_datagram = (ti.flag & TransportFlag.DATAGRAM)
+        self.is_reliable = bool(ti.flag & TransportFlag.RELIABLE)
+        self.is_secure = bool(ti.flag & TransportFlag.SECURE)
+        self.is_datagram = bool(ti.flag & TransportFlag.DATAGRAM)
         self.host = ti.addr
         self.port = ti.port
         self.ref_cnt = ti.usage_count
@@ -580,25 +592,29 @@ class Transport:
     "SIP transport class."
     _id = -1
     _lib = None
-    _obj_name = ""
+    _obj_name = None
 
     def __init__(self, lib, id):
         self._lib = weakref.proxy(lib)
         self._id = id
-        self._obj_name = "{Transport " + self.info().description + "}"
         _Trace((self, 'created'))
 
     def __del__(self):
         _Trace((self, 'destroyed'))
         
     def __str__(self):
+        if self._obj_name is None:
+            ti = _transport_get_info(self._id)
+            self._obj_name = "{Transport %s}" % (ti.info if ti else "?")
         return self._obj_name
 
+    __repr__ = __str__
+
     def info(self):
         """Get TransportInfo.
         """
         lck = self._lib.auto_lock()
-        ti = _pjsua.transport_get_info(self._id)
+        ti = _transport_get_info(self._id)
         if not ti:
             self._lib._err_check("info()", self, -1, "Invalid transport")
         return TransportInfo(ti)
@@ -626,7 +642,7 @@ class Transport:
         self._lib._err_check("close()", self, err)
 
 
-class SIPUri:
+class SIPUri(object):
     """Helper class to parse the most important components of SIP URI.
 
     Member documentation:
@@ -639,15 +655,17 @@ class SIPUri:
                  specified.
 
     """
-    scheme = ""
-    user = ""
-    host = ""
-    port = 0
-    transport = ""
+    __slots__ = ('scheme', 'user', 'host', 'port', 'transport')
 
     def __init__(self, uri=None):
         if uri:
             self.decode(uri)
+        else:
+            self.scheme = ""
+            self.user = ""
+            self.host = ""
+            self.port = 0
+            self.transport = ""
 
     def decode(self, uri):
         """Parse SIP URL.
@@ -657,7 +675,7 @@ class SIPUri:
 
         """
         self.scheme, self.user, self.host, self.port, self.transport = \
-            _pjsua.parse_simple_uri(uri)
+            _parse_simple_uri(uri)
 
     def encode(self):
         """Encode this object into SIP URI string.
@@ -666,20 +684,25 @@ class SIPUri:
             URI string.
 
         """
-        output = self.scheme + ":"
-        if self.user and len(self.user):
-            output = output + self.user + "@"
-        output = output + self.host
+        parts = _uri_parts_buf()
+        parts.append(self.scheme)
+        parts.append(":")
+        if self.user:
+            parts.append(self.user)
+            parts.append("@")
+        parts.append(self.host)
         if self.port:
-            output = output + ":" + output(self.port)
+            parts.append(":")
+            parts.append(str(self.port))
         if self.transport:
-            output = output + ";transport=" + self.transport
-        return output
+            parts.append(";transport=")
+            parts.append(self.transport)
+        return "".join(parts)
 
 
-class AuthCred:
+class AuthCred(object):
     """Authentication credential for SIP or TURN account.
-    
+
     Member documentation:
 
     scheme      -- authentication scheme (default is "Digest")
@@ -688,11 +711,7 @@ class AuthCred:
     passwd_type -- password encoding (zero for plain-text)
     passwd      -- the password
     """
-    scheme = "Digest"
-    realm = "*"
-    username = ""
-    passwd_type = 0
-    passwd = ""
+    __slots__ = ('scheme', 'realm', 'username', 'passwd_type', 'passwd')
 
     def __init__(self, realm, username, passwd, scheme="Digest", passwd_type=0):
         self.scheme = scheme
@@ -702,7 +721,7 @@ class AuthCred:
         self.passwd = passwd
 
 
-class AccountConfig:
+class AccountConfig(object):
     """ This describes account configuration to create an account.
 
     Member documentation:
@@ -756,27 +775,15 @@ class AccountConfig:
     rtp_transport_cfg       -- the rtp-transport-configuration that is usede, when
                                a rtp-connection is being established.
     """
-    priority = 0
-    id = ""
-    force_contact = ""
-    reg_uri = ""
-    reg_timeout = 0
-    require_100rel = False
-    publish_enabled = False
-    pidf_tuple_id = ""
-    proxy = []
-    auth_cred = []
-    auth_initial_send = False
-    auth_initial_algorithm = ""
-    transport_id = -1
-    allow_contact_rewrite = True
-    ka_interval = 15
-    ka_data = "\r\n"
-    use_srtp = 0
-    srtp_secure_signaling = 1
-    rtp_transport_cfg = None
-
-    def __init__(self, domain="", username="", password="", 
+    __slots__ = ('priority', 'id', 'force_contact', 'reg_uri',
+                 'reg_timeout', 'require_100rel', 'publish_enabled',
+                 'pidf_tuple_id', 'proxy', 'auth_cred',
+                 'auth_initial_send', 'auth_initial_algorithm',
+                 'transport_id', 'allow_contact_rewrite', 'ka_interval',
+                 'ka_data', 'use_srtp', 'srtp_secure_signaling',
+                 'rtp_transport_cfg')
+
+    def __init__(self, domain="", username="", password="",
                  display="", registrar="", proxy=""):
         """
         Construct account config. If domain argument is specified, 
@@ -795,7 +802,10 @@ class AccountConfig:
                      will be constructed from the domain name.
 
         """
-        default = _pjsua.acc_config_default()
+        self.proxy = []
+        self.auth_cred = []
+        self.rtp_transport_cfg = None
+        default = _acc_config_default()
         self._cvt_from_pjsua(default)
         if domain!="":
             self.build_config(domain, username, password,
@@ -826,15 +836,15 @@ class AccountConfig:
         userpart = username
         if userpart != "":
             userpart = userpart + "@"
-        self.id = display + "<sip:" + userpart + domain + ">"
+        self.id = "%s<sip:%s%s>" % (display, userpart, domain)
         self.reg_uri = registrar
         if self.reg_uri == "":
             self.reg_uri = "sip:" + domain
         if proxy == "":
             proxy = "sip:" + domain + ";lr"
-        if proxy.find(";lr") == -1:
+        elif ";lr" not in proxy:
             proxy = proxy + ";lr"
-        self.proxy.append(proxy)
+        self.proxy = [proxy]
         if username != "":
             self.auth_cred.append(AuthCred("*", username, password))
         
@@ -853,10 +863,9 @@ class AccountConfig:
         self.publish_enabled = cfg.publish_enabled
         self.pidf_tuple_id = cfg.pidf_tuple_id
         self.proxy = cfg.proxy
-        for cred in cfg.cred_info:
-            self.auth_cred.append(AuthCred(cred.realm, cred.username, 
-                                           cred.data, cred.scheme,
-                                           cred.data_type))
+        self.auth_cred = [AuthCred(cred.realm, cred.username, cred.data,
+                                   cred.scheme, cred.data_type)
+                          for cred in cfg.cred_info]
         self.auth_initial_send = cfg.auth_initial_send
         self.auth_initial_algorithm = cfg.auth_initial_algorithm
         self.transport_id = cfg.transport_id
@@ -868,43 +877,33 @@ class AccountConfig:
         if (self.rtp_transport_cfg is not None):
             self.rtp_transport_cfg._cvt_from_pjsua(cfg.rtp_transport_cfg)
 
+    _cvt_flat = _gen_cvt_to_pjsua('acc_config_default',
+        ('priority', 'id', 'force_contact', 'reg_uri', 'reg_timeout',
+         'require_100rel', 'publish_enabled', 'pidf_tuple_id', 'proxy',
+         'auth_initial_send', 'auth_initial_algorithm', 'transport_id',
+         'allow_contact_rewrite', 'ka_interval', 'ka_data', 'use_srtp',
+         'srtp_secure_signaling'))
+
     def _cvt_to_pjsua(self):
-        cfg = _pjsua.acc_config_default()
-        cfg.priority = self.priority
-        cfg.id = self.id
-        cfg.force_contact = self.force_contact
-        cfg.reg_uri = self.reg_uri
-        cfg.reg_timeout = self.reg_timeout
-        cfg.require_100rel = self.require_100rel
-        cfg.publish_enabled = self.publish_enabled
-        cfg.pidf_tuple_id = self.pidf_tuple_id
-        cfg.proxy = self.proxy
+        cfg = self._cvt_flat()
+        cred_info_new = _Pjsip_Cred_Info
         for cred in self.auth_cred:
-            c = _pjsua.Pjsip_Cred_Info()
+            c = cred_info_new()
             c.realm = cred.realm
             c.scheme = cred.scheme
             c.username = cred.username
             c.data_type = cred.passwd_type
             c.data = cred.passwd
             cfg.cred_info.append(c)
-            
-        cfg.auth_initial_send = self.auth_initial_send
-        cfg.auth_initial_algorithm = self.auth_initial_algorithm
-        cfg.transport_id = self.transport_id
-        cfg.allow_contact_rewrite = self.allow_contact_rewrite
-        cfg.ka_interval = self.ka_interval
-        cfg.ka_data = self.ka_data
-        cfg.use_srtp = self.use_srtp
-        cfg.srtp_secure_signaling = self.srtp_secure_signaling
 
         if (self.rtp_transport_cfg is not None):
             cfg.rtp_transport_cfg = self.rtp_transport_cfg._cvt_to_pjsua()
-        
+
         return cfg
  
  
 # Account information
-class AccountInfo:
+class AccountInfo(object):
     """This describes Account info. Application retrives account info
     with Account.info().
 
@@ -925,27 +924,37 @@ class AccountInfo:
     online_text     -- the account's presence status text.
 
     """
-    is_default = False
-    uri = ""
-    reg_active = False
-    reg_expires = -1
-    reg_status = 0
-    reg_reason = ""
-    online_status = False
-    online_text = ""
+    __slots__ = ('_raw', 'is_default', 'uri', 'reg_active', 'reg_expires',
+                 'reg_status', 'reg_reason', 'online_status',
+                 'online_text')
+
+    _FIELD_MAP = {
+        'is_default':    'is_default',
+        'uri':           'acc_uri',
+        'reg_active':    'has_registration',
+        'reg_expires':   'expires',
+        'reg_status':    'status',
+        'reg_reason':    'status_text',
+        'online_status': 'online_status',
+        'online_text':   'online_status_text',
+    }
 
     def __init__(self, ai):
-        self.is_default = ai.is_default
-        self.uri = ai.acc_uri
-        self.reg_active = ai.has_registration
-        self.reg_expires = ai.expires
-        self.reg_status = ai.status
-        self.reg_reason = ai.status_text
-        self.online_status = ai.online_status
-        self.online_text = ai.online_status_text
+        self._raw = ai
+
+    def __getattr__(self, name):
+        # Fields are converted from the underlying _pjsua info on first
+        # access and cached, so callers that read one or two members
+        # don't pay for copying the whole struct.
+        try:
+            val = getattr(self._raw, self._FIELD_MAP[name])
+        except KeyError:
+            raise AttributeError(name)
+        setattr(self, name, val)
+        return val
 
 # Account callback
-class AccountCallback:
+class AccountCallback(object):
     """Class to receive notifications on account's events.
 
     Derive a class from this class and register it to the Account object
@@ -957,7 +966,7 @@ class AccountCallback:
     account     -- the Account object.
 
     """
-    account = None
+    __slots__ = ('account',)
 
     def __init__(self, account=None):
         self._set_account(account)
@@ -1089,7 +1098,15 @@ class AccountCallback:
 
 
 
-class Account:
+# Shared no-op callback instances, used when an object has no
+# application callback installed. They carry no per-object state (their
+# account/call/buddy members stay None), so one instance per class is
+# enough.
+_NULL_ACCOUNT_CB = AccountCallback(None)
+_EMPTY_CB_NAMES = frozenset()
+
+
+class Account(object):
     """This describes SIP account class.
 
     PJSUA accounts provide identity (or identities) of the user who is 
@@ -1115,10 +1132,8 @@ class Account:
     accounts.
 
     """
-    _id = -1        
-    _lib = None
-    _cb = AccountCallback(None)
-    _obj_name = ""
+    __slots__ = ('_id', '_lib', '_cb', '_cb_names', '_obj_name',
+                 '_pres_pending', '__weakref__')
 
     def __init__(self, lib, id, cb=None):
         """Construct this class. This is normally called by Lib class and
@@ -1133,7 +1148,8 @@ class Account:
         """
         self._id = id
         self._lib = weakref.ref(lib)
-        self._obj_name = "{Account " + self.info().uri + "}"
+        self._obj_name = None
+        self._pres_pending = None
         self.set_callback(cb)
         _pjsua.acc_set_user_data(self._id, self)
         _Trace((self, 'created'))
@@ -1144,13 +1160,16 @@ class Account:
         _Trace((self, 'destroyed'))
 
     def __str__(self):
+        if self._obj_name is None:
+            ai = _acc_get_info(self._id)
+            self._obj_name = "{Account %s}" % (ai.acc_uri if ai else "?")
         return self._obj_name
 
     def info(self):
         """Retrieve AccountInfo for this account.
         """
         lck = self._lib().auto_lock()
-        ai = _pjsua.acc_get_info(self._id)
+        ai = _acc_get_info(self._id)
         if ai==None:
             self._lib()._err_check("info()", self, -1, "Invalid account")
         return AccountInfo(ai)
@@ -1172,9 +1191,12 @@ class Account:
         """
         if cb:
             self._cb = cb
+            cb._set_account(self)
+            self._cb_names = _cb_overridden_names(cb, AccountCallback,
+                                                  _ACC_NOOP_CBS)
         else:
-            self._cb = AccountCallback(self)
-        self._cb._set_account(self)
+            self._cb = _NULL_ACCOUNT_CB
+            self._cb_names = _EMPTY_CB_NAMES
 
     def set_default(self):
         """ Set this account as default account to send outgoing requests
@@ -1190,8 +1212,7 @@ class Account:
 
         """
         lck = self._lib().auto_lock()
-        def_id = _pjsua.acc_get_default()
-        return self.is_valid() and def_id==self._id
+        return self._id != -1 and _pjsua.acc_get_default() == self._id
 
     def delete(self):
         """ Delete this account.
@@ -1211,9 +1232,13 @@ class Account:
         is_online   -- boolean to indicate basic presence availability.
 
         """
+        if self._pres_pending is not None:
+            self._pres_pending['is_online'] = is_online
+            return
         lck = self._lib().auto_lock()
         err = _pjsua.acc_set_online_status(self._id, is_online)
-        self._lib()._err_check("set_basic_status()", self, err)
+        if err:
+            self._lib()._err_check("set_basic_status()", self, err)
 
     def set_presence_status(self, is_online, 
                             activity=PresenceActivity.UNKNOWN, 
@@ -1228,10 +1253,46 @@ class Account:
         rpid_id     -- optional string to be placed as RPID ID. 
 
         """
+        if self._pres_pending is not None:
+            self._pres_pending.update(is_online=is_online,
+                                      activity=activity,
+                                      pres_text=pres_text,
+                                      rpid_id=rpid_id)
+            return
         lck = self._lib().auto_lock()
         err = _pjsua.acc_set_online_status2(self._id, is_online, activity,
                                             pres_text, rpid_id)
-        self._lib()._err_check("set_presence_status()", self, err)
+        if err:
+            self._lib()._err_check("set_presence_status()", self, err)
+
+    def begin_presence_update(self):
+        """Start batching presence changes for this account.
+
+        Until commit_presence_update() is called, set_basic_status() and
+        set_presence_status() only stage their values instead of each
+        triggering a separate PUBLISH/NOTIFY round.
+        """
+        if self._pres_pending is None:
+            self._pres_pending = {}
+
+    def commit_presence_update(self):
+        """Flush presence changes staged since begin_presence_update()
+        with a single status update.
+        """
+        pending = self._pres_pending
+        self._pres_pending = None
+        if not pending:
+            return
+        lck = self._lib().auto_lock()
+        err = _pjsua.acc_set_online_status2(
+                        self._id,
+                        pending.get('is_online', True),
+                        pending.get('activity',
+                                    PresenceActivity.UNKNOWN),
+                        pending.get('pres_text', ""),
+                        pending.get('rpid_id', ""))
+        if err:
+            self._lib()._err_check("commit_presence_update()", self, err)
 
     def set_registration(self, renew):
         """Manually renew registration or unregister from the server.
@@ -1243,7 +1304,8 @@ class Account:
         """
         lck = self._lib().auto_lock()
         err = _pjsua.acc_set_registration(self._id, renew)
-        self._lib()._err_check("set_registration()", self, err)
+        if err:
+            self._lib()._err_check("set_registration()", self, err)
 
     def set_transport(self, transport):
         """Set this account to only use the specified transport to send
@@ -1275,8 +1337,9 @@ class Account:
         lck = self._lib().auto_lock()
         call = Call(self._lib(), -1, cb)
         err, cid = _pjsua.call_make_call(self._id, dst_uri, 0, 
-                                         call, Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("make_call()", self, err)
+                                         call, _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("make_call()", self, err)
         call.attach_to_id(cid)
         return call
 
@@ -1298,7 +1361,8 @@ class Account:
         buddy_cfg.uri = uri
         buddy_cfg.subscribe = False
         err, buddy_id = _pjsua.buddy_add(buddy_cfg)
-        self._lib()._err_check("add_buddy()", self, err)
+        if err:
+            self._lib()._err_check("add_buddy()", self, err)
         buddy = Buddy(self._lib(), buddy_id, self, cb)
         return buddy
 
@@ -1315,7 +1379,7 @@ class Account:
         """
         lck = self._lib().auto_lock()
         _pjsua.acc_pres_notify(self._id, pres_obj, state, reason, 
-                               Lib._create_msg_data(hdr_list))
+                               _create_msg_data(hdr_list))
     
     def send_pager(self, uri, text, im_id=0, content_type="text/plain", \
                    hdr_list=None):
@@ -1333,11 +1397,12 @@ class Account:
 
         """
         lck = self._lib().auto_lock()
-        err = _pjsua.im_send(self._id, uri, \
+        err = _im_send(self._id, uri, \
                              content_type, text, \
-                             Lib._create_msg_data(hdr_list), \
+                             _create_msg_data(hdr_list), \
                              im_id)
-        self._lib()._err_check("send_pager()", self, err)
+        if err:
+            self._lib()._err_check("send_pager()", self, err)
 
 class CallCallback:
     """Class to receive event notification from Call objects. 
@@ -1486,7 +1551,7 @@ class CallCallback:
         pass
 
 
-class CallInfo:
+class CallInfo(object):
     """This structure contains various information about Call.
 
     Application may retrieve this information with Call.info().
@@ -1510,58 +1575,93 @@ class CallInfo:
     call_time       -- call's connected duration in seconds.
     total_time      -- total call duration in seconds.
     """
-    role = CallRole.CALLER
-    account = None
-    uri = ""
-    contact = ""
-    remote_uri = ""
-    remote_contact = ""
-    sip_call_id = ""
-    state = CallState.NULL
-    state_text = ""
-    last_code = 0
-    last_reason = ""
-    media_state = MediaState.NULL
-    media_dir = MediaDir.NULL
-    conf_slot = -1
-    call_time = 0
-    total_time = 0
+    __slots__ = ('_lib', '_raw', 'role', 'account', 'uri', 'contact',
+                 'remote_uri', 'remote_contact', 'sip_call_id', 'state',
+                 'state_text', 'last_code', 'last_reason', 'media_state',
+                 'media_dir', 'conf_slot', 'call_time', 'total_time')
+
+    _FIELD_MAP = {
+        'role':           'role',
+        'uri':            'local_info',
+        'contact':        'local_contact',
+        'remote_uri':     'remote_info',
+        'remote_contact': 'remote_contact',
+        'sip_call_id':    'call_id',
+        'state':          'state',
+        'state_text':     'state_text',
+        'last_code':      'last_status',
+        'last_reason':    'last_status_text',
+        'media_state':    'media_status',
+        'media_dir':      'media_dir',
+        'conf_slot':      'conf_slot',
+    }
+
+    _DEFAULTS = {
+        'role':           CallRole.CALLER,
+        'account':        None,
+        'uri':            "",
+        'contact':        "",
+        'remote_uri':     "",
+        'remote_contact': "",
+        'sip_call_id':    "",
+        'state':          CallState.NULL,
+        'state_text':     "",
+        'last_code':      0,
+        'last_reason':    "",
+        'media_state':    MediaState.NULL,
+        'media_dir':      MediaDir.NULL,
+        'conf_slot':      -1,
+        'call_time':      0,
+        'total_time':     0,
+    }
 
     def __init__(self, lib=None, ci=None):
         if lib and ci:
-            self._cvt_from_pjsua(lib, ci)
-
-    def _cvt_from_pjsua(self, lib, ci):
-        self.role = ci.role
-        self.account = lib._lookup_account(ci.acc_id)
-        self.uri = ci.local_info
-        self.contact = ci.local_contact
-        self.remote_uri = ci.remote_info
-        self.remote_contact = ci.remote_contact
-        self.sip_call_id = ci.call_id
-        self.state = ci.state
-        self.state_text = ci.state_text
-        self.last_code = ci.last_status
-        self.last_reason = ci.last_status_text
-        self.media_state = ci.media_status
-        self.media_dir = ci.media_dir
-        self.conf_slot = ci.conf_slot
-        self.call_time = ci.connect_duration / 1000
-        self.total_time = ci.total_duration / 1000
-
-
-class Call:
+            self._lib = weakref.ref(lib)
+            self._raw = ci
+        else:
+            self._lib = None
+            self._raw = None
+
+    def __getattr__(self, name):
+        # Convert from the underlying _pjsua call info on first access
+        # and cache the result; most callers only read a field or two.
+        raw = self._raw
+        if raw is None:
+            try:
+                val = self._DEFAULTS[name]
+            except KeyError:
+                raise AttributeError(name)
+        elif name == 'account':
+            lib = self._lib()
+            val = lib._lookup_account(raw.acc_id) if lib else None
+        elif name == 'call_time':
+            val = raw.connect_duration / 1000
+        elif name == 'total_time':
+            val = raw.total_duration / 1000
+        else:
+            try:
+                val = getattr(raw, self._FIELD_MAP[name])
+            except KeyError:
+                raise AttributeError(name)
+        setattr(self, name, val)
+        return val
+
+
+_NULL_CALL_CB = CallCallback(None)
+
+
+class Call(object):
     """This class represents SIP call.
 
     Application initiates outgoing call with Account.make_call(), and
     incoming calls are reported in AccountCallback.on_incoming_call().
     """
-    _id = -1
-    _cb = None
-    _lib = None
-    _obj_name = ""
+    __slots__ = ('_id', '_lib', '_cb', '_cb_names', '_obj_name',
+                 '__weakref__')
 
     def __init__(self, lib, call_id, cb=None):
+        self._id = -1
         self._lib = weakref.ref(lib)
         self.set_callback(cb)
         self.attach_to_id(call_id)
@@ -1573,6 +1673,12 @@ class Call:
         _Trace((self, 'destroyed'))
 
     def __str__(self):
+        if self._obj_name is None:
+            if self._id != -1:
+                ci = _call_get_info(self._id)
+                self._obj_name = "{Call %s}" % (ci.remote_info if ci else "?")
+            else:
+                self._obj_name = "{Call object}"
         return self._obj_name
 
     def attach_to_id(self, call_id):
@@ -1580,11 +1686,9 @@ class Call:
         if self._id != -1:
             _pjsua.call_set_user_data(self._id, 0)
         self._id = call_id
+        self._obj_name = None
         if self._id != -1:
             _pjsua.call_set_user_data(self._id, self)
-            self._obj_name = "{Call " + self.info().remote_uri + "}"
-        else:
-            self._obj_name = "{Call object}"
 
     def set_callback(self, cb):
         """
@@ -1595,16 +1699,19 @@ class Call:
         """
         if cb:
             self._cb = cb
+            cb._set_call(self)
+            self._cb_names = _cb_overridden_names(cb, CallCallback,
+                                                  _CALL_NOOP_CBS)
         else:
-            self._cb = CallCallback(self)
-        self._cb._set_call(self)
+            self._cb = _NULL_CALL_CB
+            self._cb_names = _EMPTY_CB_NAMES
 
     def info(self):
         """
         Get the CallInfo.
         """
         lck = self._lib().auto_lock()
-        ci = _pjsua.call_get_info(self._id)
+        ci = _call_get_info(self._id)
         if not ci:
             self._lib()._err_check("info", self, -1, "Invalid call")
         call_info = CallInfo(self._lib(), ci)
@@ -1637,9 +1744,10 @@ class Call:
 
         """
         lck = self._lib().auto_lock()
-        err = _pjsua.call_answer(self._id, code, reason, 
-                                   Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("answer()", self, err)
+        err = _call_answer(self._id, code, reason, 
+                                   _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("answer()", self, err)
 
     def hangup(self, code=603, reason="", hdr_list=None):
         """
@@ -1654,9 +1762,10 @@ class Call:
 
         """
         lck = self._lib().auto_lock()
-        err = _pjsua.call_hangup(self._id, code, reason, 
-                                   Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("hangup()", self, err)
+        err = _call_hangup(self._id, code, reason, 
+                                   _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("hangup()", self, err)
 
     def hold(self, hdr_list=None):
         """
@@ -1667,8 +1776,9 @@ class Call:
                     message.
         """
         lck = self._lib().auto_lock()
-        err = _pjsua.call_set_hold(self._id, Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("hold()", self, err)
+        err = _pjsua.call_set_hold(self._id, _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("hold()", self, err)
 
     def unhold(self, hdr_list=None):
         """
@@ -1681,8 +1791,9 @@ class Call:
         """
         lck = self._lib().auto_lock()
         err = _pjsua.call_reinvite(self._id, True, 
-                                     Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("unhold()", self, err)
+                                     _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("unhold()", self, err)
 
     def reinvite(self, hdr_list=None):
         """
@@ -1695,8 +1806,9 @@ class Call:
         """
         lck = self._lib().auto_lock()
         err = _pjsua.call_reinvite(self._id, True, 
-                                     Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("reinvite()", self, err)
+                                     _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("reinvite()", self, err)
 
     def update(self, hdr_list=None, options=0):
         """
@@ -1710,8 +1822,9 @@ class Call:
         """
         lck = self._lib().auto_lock()
         err = _pjsua.call_update(self._id, options, 
-                                   Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("update()", self, err)
+                                   _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("update()", self, err)
 
     def transfer(self, dest_uri, hdr_list=None):
         """
@@ -1725,8 +1838,9 @@ class Call:
         """
         lck = self._lib().auto_lock()
         err = _pjsua.call_xfer(self._id, dest_uri, 
-                                 Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("transfer()", self, err)
+                                 _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("transfer()", self, err)
 
     def transfer_to_call(self, call, hdr_list=None, options=0):
         """
@@ -1741,8 +1855,9 @@ class Call:
         """
         lck = self._lib().auto_lock()
         err = _pjsua.call_xfer_replaces(self._id, call._id, options,
-                                          Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("transfer_to_call()", self, err)
+                                          _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("transfer_to_call()", self, err)
 
     def dial_dtmf(self, digits):
         """
@@ -1753,8 +1868,9 @@ class Call:
 
         """
         lck = self._lib().auto_lock()
-        err = _pjsua.call_dial_dtmf(self._id, digits)
-        self._lib()._err_check("dial_dtmf()", self, err)
+        err = _call_dial_dtmf(self._id, digits)
+        if err:
+            self._lib()._err_check("dial_dtmf()", self, err)
 
     def send_request(self, method, hdr_list=None, content_type=None,
                      body=None):
@@ -1774,7 +1890,7 @@ class Call:
 
         """
         lck = self._lib().auto_lock()
-        if hdr_list or body:
+        if hdr_list or content_type or body:
             msg_data = _pjsua.Msg_Data()
             if hdr_list:
                 msg_data.hdr_list = hdr_list
@@ -1786,7 +1902,8 @@ class Call:
             msg_data = None
                 
         err = _pjsua.call_send_request(self._id, method, msg_data)
-        self._lib()._err_check("send_request()", self, err)
+        if err:
+            self._lib()._err_check("send_request()", self, err)
 
     def send_pager(self, text, im_id=0, content_type="text/plain", 
     		   hdr_list=None):
@@ -1805,12 +1922,13 @@ class Call:
         lck = self._lib().auto_lock()
         err = _pjsua.call_send_im(self._id, \
                              content_type, text, \
-                             Lib._create_msg_data(hdr_list), \
+                             _create_msg_data(hdr_list), \
                              im_id)
-        self._lib()._err_check("send_pager()", self, err)
+        if err:
+            self._lib()._err_check("send_pager()", self, err)
 
   
-class BuddyInfo:
+class BuddyInfo(object):
     """This class contains information about Buddy. Application may 
     retrieve this information by calling Buddy.info().
 
@@ -1827,28 +1945,51 @@ class BuddyInfo:
     sub_term_reason -- The termination reason string of the last presence
                        subscription to this buddy, if any.
     """
-    uri = ""
-    contact = ""
-    online_status = 0
-    online_text = ""
-    activity = PresenceActivity.UNKNOWN
-    subscribed = False
-    sub_state = SubscriptionState.NULL
-    sub_term_reason = ""
+    __slots__ = ('_raw', 'uri', 'contact', 'online_status', 'online_text',
+                 'activity', 'subscribed', 'sub_state', 'sub_term_reason')
+
+    _FIELD_MAP = {
+        'uri':             'uri',
+        'contact':         'contact',
+        'online_status':   'status',
+        'online_text':     'status_text',
+        'activity':        'activity',
+        'subscribed':      'monitor_pres',
+        'sub_state':       'sub_state',
+        'sub_term_reason': 'sub_term_reason',
+    }
+
+    _DEFAULTS = {
+        'uri':             "",
+        'contact':         "",
+        'online_status':   0,
+        'online_text':     "",
+        'activity':        PresenceActivity.UNKNOWN,
+        'subscribed':      False,
+        'sub_state':       SubscriptionState.NULL,
+        'sub_term_reason': "",
+    }
 
     def __init__(self, pjsua_bi=None):
-        if pjsua_bi:
-            self._cvt_from_pjsua(pjsua_bi)
-
-    def _cvt_from_pjsua(self, inf):
-        self.uri = inf.uri
-        self.contact = inf.contact
-        self.online_status = inf.status
-        self.online_text = inf.status_text
-        self.activity = inf.activity
-        self.subscribed = inf.monitor_pres
-        self.sub_state = inf.sub_state
-        self.sub_term_reason = inf.sub_term_reason
+        self._raw = pjsua_bi
+
+    def __getattr__(self, name):
+        # Convert from the underlying _pjsua buddy info on first access
+        # and cache the result; a presence refresh over a large buddy
+        # list rarely reads more than a field or two per buddy.
+        raw = self._raw
+        if raw is None:
+            try:
+                val = self._DEFAULTS[name]
+            except KeyError:
+                raise AttributeError(name)
+        else:
+            try:
+                val = getattr(raw, self._FIELD_MAP[name])
+            except KeyError:
+                raise AttributeError(name)
+        setattr(self, name, val)
+        return val
 
 
 class BuddyCallback:
@@ -1913,25 +2054,29 @@ class BuddyCallback:
         pass
 
 
-class Buddy:
+_NULL_BUDDY_CB = BuddyCallback(None)
+
+
+class Buddy(object):
     """A Buddy represents person or remote agent.
 
     This class provides functions to subscribe to buddy's presence and
     to send or receive instant messages from the buddy.
     """
-    _id = -1
-    _lib = None
-    _cb = None
-    _obj_name = ""
-    _acc = None
+    __slots__ = ('_id', '_lib', '_acc', '_cb', '_cb_names', '_uri',
+                 '_obj_name', '__weakref__')
 
     def __init__(self, lib, id, account, cb):
         self._id = id
         self._lib = weakref.ref(lib)
         self._acc = weakref.ref(account)
-        self._obj_name = "{Buddy " + self.info().uri + "}"
+        inf = _buddy_get_info(self._id)
+        self._uri = inf.uri if inf else ""
+        self._obj_name = None
         self.set_callback(cb)
         _pjsua.buddy_set_user_data(self._id, self)
+        if self._uri:
+            lib._buddy_by_uri[self._uri] = self
         _Trace((self, 'created'))
 
     def __del__(self):
@@ -1940,6 +2085,8 @@ class Buddy:
         _Trace((self, 'destroyed'))
 
     def __str__(self):
+        if self._obj_name is None:
+            self._obj_name = "{Buddy %s}" % (self._uri or "?")
         return self._obj_name
 
     def info(self):
@@ -1947,7 +2094,7 @@ class Buddy:
         Get buddy info as BuddyInfo.
         """
         lck = self._lib().auto_lock()
-        return BuddyInfo(_pjsua.buddy_get_info(self._id))
+        return BuddyInfo(_buddy_get_info(self._id))
 
     def set_callback(self, cb):
         """Install callback to receive notifications from this object.
@@ -1957,9 +2104,12 @@ class Buddy:
         """
         if cb:
             self._cb = cb
+            cb._set_buddy(self)
+            self._cb_names = _cb_overridden_names(cb, BuddyCallback,
+                                                  _BUDDY_NOOP_CBS)
         else:
-            self._cb = BuddyCallback(self)
-        self._cb._set_buddy(self)
+            self._cb = _NULL_BUDDY_CB
+            self._cb_names = _EMPTY_CB_NAMES
 
     def subscribe(self):
         """
@@ -1967,7 +2117,8 @@ class Buddy:
         """
         lck = self._lib().auto_lock()
         err = _pjsua.buddy_subscribe_pres(self._id, True)
-        self._lib()._err_check("subscribe()", self, err)
+        if err:
+            self._lib()._err_check("subscribe()", self, err)
 
     def unsubscribe(self):
         """
@@ -1975,7 +2126,8 @@ class Buddy:
         """
         lck = self._lib().auto_lock()
         err = _pjsua.buddy_subscribe_pres(self._id, False)
-        self._lib()._err_check("unsubscribe()", self, err)
+        if err:
+            self._lib()._err_check("unsubscribe()", self, err)
 
     def delete(self):
         """
@@ -1984,6 +2136,7 @@ class Buddy:
         lck = self._lib().auto_lock()
         if self._id != -1:
             _pjsua.buddy_set_user_data(self._id, 0)
+        self._lib()._buddy_by_uri.pop(self._uri, None)
         err = _pjsua.buddy_del(self._id)
         self._lib()._err_check("delete()", self, err)
 
@@ -2002,11 +2155,12 @@ class Buddy:
 
         """
         lck = self._lib().auto_lock()
-        err = _pjsua.im_send(self._acc()._id, self.info().uri, \
+        err = _im_send(self._acc()._id, self._uri, \
                              content_type, text, \
-                             Lib._create_msg_data(hdr_list), \
+                             _create_msg_data(hdr_list), \
                              im_id)
-        self._lib()._err_check("send_pager()", self, err)
+        if err:
+            self._lib()._err_check("send_pager()", self, err)
 
     def send_typing_ind(self, is_typing=True, hdr_list=None):
         """Send typing indication to remote buddy.
@@ -2018,14 +2172,15 @@ class Buddy:
 
         """
         lck = self._lib().auto_lock()
-        err = _pjsua.im_typing(self._acc()._id, self.info().uri, \
-                               is_typing, Lib._create_msg_data(hdr_list))
-        self._lib()._err_check("send_typing_ind()", self, err)
+        err = _im_typing(self._acc()._id, self._uri, \
+                               is_typing, _create_msg_data(hdr_list))
+        if err:
+            self._lib()._err_check("send_typing_ind()", self, err)
 
 
 
 # Sound device info
-class SoundDeviceInfo:
+class SoundDeviceInfo(object):
     """This described the sound device info.
 
     Member documentation:
@@ -2034,10 +2189,8 @@ class SoundDeviceInfo:
     output_channels     -- number of playback channels supported.
     default_clock_rate  -- default sampling rate.
     """
-    name = ""
-    input_channels = 0
-    output_channels = 0
-    default_clock_rate = 0
+    __slots__ = ('name', 'input_channels', 'output_channels',
+                 'default_clock_rate')
 
     def __init__(self, sdi):
         self.name = sdi.name
@@ -2047,7 +2200,7 @@ class SoundDeviceInfo:
 
 
 # Codec info
-class CodecInfo:
+class CodecInfo(object):
     """This describes codec info.
 
     Member documentation:
@@ -2064,29 +2217,23 @@ class CodecInfo:
     plc_enabled     -- specify if Packet Lost Concealment is currently
                        enabled.
     """
-    name = ""
-    priority = 0
-    clock_rate = 0
-    channel_count = 0
-    avg_bps = 0
-    frm_ptime = 0
-    ptime = 0
-    pt = 0
-    vad_enabled = False
-    plc_enabled = False
+    __slots__ = ('name', 'priority', 'clock_rate', 'channel_count',
+                 'avg_bps', 'frm_ptime', 'ptime', 'pt', 'vad_enabled',
+                 'plc_enabled')
 
     def __init__(self, codec_info, codec_param):
+        info = codec_param.info
+        setting = codec_param.setting
         self.name = codec_info.codec_id
         self.priority = codec_info.priority
-        self.clock_rate = codec_param.info.clock_rate
-        self.channel_count = codec_param.info.channel_cnt
-        self.avg_bps = codec_param.info.avg_bps
-        self.frm_ptime = codec_param.info.frm_ptime
-        self.ptime = codec_param.info.frm_ptime * \
-                        codec_param.setting.frm_per_pkt
-        self.ptime = codec_param.info.pt
-        self.vad_enabled = codec_param.setting.vad
-        self.plc_enabled = codec_param.setting.plc
+        self.clock_rate = info.clock_rate
+        self.channel_count = info.channel_cnt
+        self.avg_bps = info.avg_bps
+        self.frm_ptime = info.frm_ptime
+        self.ptime = info.frm_ptime * setting.frm_per_pkt
+        self.pt = info.pt
+        self.vad_enabled = setting.vad
+        self.plc_enabled = setting.plc
 
     def _cvt_to_pjsua(self):
         ci = _pjsua.Codec_Info()
@@ -2096,7 +2243,7 @@ class CodecInfo:
 
 
 # Codec parameter
-class CodecParameter:
+class CodecParameter(object):
     """This specifies various parameters that can be configured for codec.
 
     Member documentation:
@@ -2105,11 +2252,8 @@ class CodecParameter:
     vad_enabled -- specify if VAD should be enabled.
     plc_enabled -- specify if PLC should be enabled.
     """
-    ptime = 0
-    vad_enabled = False
-    plc_enabled = False
-    _codec_param = None
-    
+    __slots__ = ('ptime', 'vad_enabled', 'plc_enabled', '_codec_param')
+
     def __init__(self, codec_param):
         self.ptime = codec_param.info.frm_ptime * \
                         codec_param.setting.frm_per_pkt
@@ -2141,6 +2285,56 @@ class _LibMutex:
             pass
 
 
+# Constant used on the per-event call state dispatch path; one module
+# global lookup instead of a class attribute traversal per event.
+_CALL_STATE_DISCONNECTED = CallState.DISCONNECTED
+
+
+def _create_msg_data(hdr_list):
+    """Build a _pjsua.Msg_Data for the given header list, or None when
+    there is nothing to attach - the common case on every SIP verb, in
+    which no Msg_Data object is allocated at all.
+
+    The Msg_Data instance is cached per thread and reused; callers pass
+    it straight into a _pjsua call before anything else on the thread
+    can touch it, so the reuse is safe.
+    """
+    if not hdr_list:
+        return None
+    msg_data = getattr(_tls, 'msg_data', None)
+    if msg_data is None:
+        msg_data = _tls.msg_data = _pjsua.Msg_Data()
+    msg_data.hdr_list = hdr_list
+    return msg_data
+
+
+def _cb_is_overridden(cb, name, base):
+    """Check whether the named callback method of cb is overridden from
+    the no-op implementation in the base callback class. Dispatchers use
+    this to skip re-entering user code for callbacks nobody implements.
+    """
+    m = getattr(cb.__class__, name, None)
+    if m is None:
+        return False
+    return getattr(m, 'im_func', m) is not getattr(base, name).im_func
+
+
+# Callbacks whose base implementation is a pure no-op, per callback
+# class. set_callback() intersects these with what the application
+# actually overrides, so event dispatch tests a precomputed set member
+# instead of re-deriving the answer per event.
+_ACC_NOOP_CBS = ('on_reg_state', 'on_pager', 'on_pager_status',
+                 'on_typing', 'on_mwi_info')
+_CALL_NOOP_CBS = ('on_state', 'on_media_state', 'on_dtmf_digit',
+                  'on_replaced', 'on_pager', 'on_pager_status',
+                  'on_typing')
+_BUDDY_NOOP_CBS = ('on_state', 'on_pager', 'on_pager_status',
+                   'on_typing')
+
+def _cb_overridden_names(cb, base, names):
+    return frozenset(n for n in names if _cb_is_overridden(cb, n, base))
+
+
 # PJSUA Library
 _lib = None
 enable_trace = False
@@ -2160,8 +2354,11 @@ class Lib:
                         "Library instance already exist")
 
         self._lock = threading.RLock()
+        self._quit_event = threading.Event()
+        self._buddy_by_uri = weakref.WeakValueDictionary()
         err = _pjsua.create()
-        self._err_check("_pjsua.create()", None, err)
+        if err:
+            self._err_check("_pjsua.create()", None, err)
         _lib = self
 
     def __del__(self):
@@ -2193,53 +2390,60 @@ class Lib:
         if not media_cfg: media_cfg = MediaConfig()
 
         py_ua_cfg = ua_cfg._cvt_to_pjsua()
-        py_ua_cfg.cb.on_call_state = _cb_on_call_state
-        py_ua_cfg.cb.on_incoming_call = _cb_on_incoming_call
-        py_ua_cfg.cb.on_call_media_state = _cb_on_call_media_state
-        py_ua_cfg.cb.on_dtmf_digit = _cb_on_dtmf_digit
-        py_ua_cfg.cb.on_call_transfer_request = _cb_on_call_transfer_request
-        py_ua_cfg.cb.on_call_transfer_status = _cb_on_call_transfer_status
-        py_ua_cfg.cb.on_call_replace_request = _cb_on_call_replace_request
-        py_ua_cfg.cb.on_call_replaced = _cb_on_call_replaced
-        py_ua_cfg.cb.on_reg_state = _cb_on_reg_state
-        py_ua_cfg.cb.on_incoming_subscribe = _cb_on_incoming_subscribe
-        py_ua_cfg.cb.on_buddy_state = _cb_on_buddy_state
-        py_ua_cfg.cb.on_pager = _cb_on_pager
-        py_ua_cfg.cb.on_pager_status = _cb_on_pager_status
-        py_ua_cfg.cb.on_typing = _cb_on_typing
-	py_ua_cfg.cb.on_mwi_info = _cb_on_mwi_info;
+        py_ua_cfg.cb.on_call_state = self._cb_on_call_state
+        py_ua_cfg.cb.on_incoming_call = self._cb_on_incoming_call
+        py_ua_cfg.cb.on_call_media_state = self._cb_on_call_media_state
+        py_ua_cfg.cb.on_dtmf_digit = self._cb_on_dtmf_digit
+        py_ua_cfg.cb.on_call_transfer_request = \
+                self._cb_on_call_transfer_request
+        py_ua_cfg.cb.on_call_transfer_status = \
+                self._cb_on_call_transfer_status
+        py_ua_cfg.cb.on_call_replace_request = \
+                self._cb_on_call_replace_request
+        py_ua_cfg.cb.on_call_replaced = self._cb_on_call_replaced
+        py_ua_cfg.cb.on_reg_state = self._cb_on_reg_state
+        py_ua_cfg.cb.on_incoming_subscribe = self._cb_on_incoming_subscribe
+        py_ua_cfg.cb.on_buddy_state = self._cb_on_buddy_state
+        py_ua_cfg.cb.on_pager = self._cb_on_pager
+        py_ua_cfg.cb.on_pager_status = self._cb_on_pager_status
+        py_ua_cfg.cb.on_typing = self._cb_on_typing
+	py_ua_cfg.cb.on_mwi_info = self._cb_on_mwi_info;
 
         err = _pjsua.init(py_ua_cfg, log_cfg._cvt_to_pjsua(), 
                           media_cfg._cvt_to_pjsua())
-        self._err_check("init()", self, err)
+        if err:
+            self._err_check("init()", self, err)
 
     def destroy(self):
         """Destroy the library, and pjsua."""
         global _lib
         if self._has_thread:
             self._quit = 1
-            loop = 0
-            while self._quit != 2 and loop < 400:
-                self.handle_events(5)
-                loop = loop + 1
-                time.sleep(0.050)
+            self._quit_event.wait(20.0)
         _pjsua.destroy()
         _lib = None
 
-    def start(self, with_thread=True):
+    def start(self, with_thread=True, worker_sleep_ms=50):
         """Start the library. 
 
         Keyword argument:
-        with_thread -- specify whether the module should create worker
-                       thread.
+        with_thread     -- specify whether the module should create worker
+                           thread.
+        worker_sleep_ms -- how long the worker thread sleeps between event
+                           polls, in milliseconds. Larger values reduce
+                           idle wakeups at the cost of event latency.
 
         """
         lck = self.auto_lock()
         err = _pjsua.start()
-        self._err_check("start()", self, err)
+        if err:
+            self._err_check("start()", self, err)
         self._has_thread = with_thread
+        self._worker_sleep = worker_sleep_ms / 1000.0
         if self._has_thread:
-            thread.start_new(_worker_thread_main, (0,))
+            t = threading.Thread(target=_worker_thread_main, args=(0,))
+            t.daemon = True
+            t.start()
 
     def handle_events(self, timeout=50):
         """Poll the events from underlying pjsua library.
@@ -2266,7 +2470,8 @@ class Lib:
 	"""
 	dummy = 1
 	err = _pjsua.thread_register(name, dummy)
-	self._err_check("thread_register()", self, err)
+	if err:
+	    self._err_check("thread_register()", self, err)
 
     def verify_sip_url(self, sip_url):
         """Verify that the specified string is a valid URI. 
@@ -2296,7 +2501,8 @@ class Lib:
         lck = self.auto_lock()
         if not cfg: cfg=TransportConfig()
         err, tp_id = _pjsua.transport_create(type, cfg._cvt_to_pjsua())
-        self._err_check("create_transport()", self, err)
+        if err:
+            self._err_check("create_transport()", self, err)
         return Transport(self, tp_id)
 
     def create_account(self, acc_config, set_default=True, cb=None):
@@ -2315,7 +2521,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err, acc_id = _pjsua.acc_add(acc_config._cvt_to_pjsua(), set_default)
-        self._err_check("create_account()", self, err)
+        if err:
+            self._err_check("create_account()", self, err)
         return Account(self, acc_id, cb)
 
     def create_account_for_transport(self, transport, set_default=True,
@@ -2334,7 +2541,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err, acc_id = _pjsua.acc_add_local(transport._id, set_default)
-        self._err_check("create_account_for_transport()", self, err)
+        if err:
+            self._err_check("create_account_for_transport()", self, err)
         return Account(self, acc_id, cb)
 
     def hangup_all(self):
@@ -2346,6 +2554,17 @@ class Lib:
 
     # Sound device API
 
+    def iter_snd_devs(self):
+        """Iterate over the sound devices in the system.
+
+        The position of each device in the iteration is its device ID.
+        """
+        lck = self.auto_lock()
+        sdi_list = _pjsua.enum_snd_devs()
+        del lck
+        for sdi in sdi_list:
+            yield SoundDeviceInfo(sdi)
+
     def enum_snd_dev(self):
         """Enumerate sound devices in the system.
 
@@ -2353,12 +2572,7 @@ class Lib:
             list of SoundDeviceInfo. The index of the element specifies
             the device ID for the device.
         """
-        lck = self.auto_lock()
-        sdi_list = _pjsua.enum_snd_devs()
-        info = []
-        for sdi in sdi_list:
-            info.append(SoundDeviceInfo(sdi))
-        return info
+        return list(self.iter_snd_devs())
 
     def get_snd_dev(self):
         """Get the device IDs of current sound devices used by pjsua.
@@ -2379,7 +2593,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.set_snd_dev(capture_dev, playback_dev)
-        self._err_check("set_current_sound_devices()", self, err)
+        if err:
+            self._err_check("set_current_sound_devices()", self, err)
     
     def set_null_snd_dev(self):
         """Disable the sound devices. This is useful if the system
@@ -2388,7 +2603,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.set_null_snd_dev()
-        self._err_check("set_null_snd_dev()", self, err)
+        if err:
+            self._err_check("set_null_snd_dev()", self, err)
 
     
     # Conference bridge
@@ -2424,7 +2640,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.conf_connect(src_slot, dst_slot)
-        self._err_check("conf_connect()", self, err)
+        if err:
+            self._err_check("conf_connect()", self, err)
     
     def conf_disconnect(self, src_slot, dst_slot):
         """Disconnect media flow from the source to destination port.
@@ -2438,7 +2655,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.conf_disconnect(src_slot, dst_slot)
-        self._err_check("conf_disconnect()", self, err)
+        if err:
+            self._err_check("conf_disconnect()", self, err)
 
     def conf_set_tx_level(self, slot, level):
         """Adjust the signal level to be transmitted from the bridge to 
@@ -2451,7 +2669,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.conf_set_tx_level(slot, level)
-        self._err_check("conf_set_tx_level()", self, err)
+        if err:
+            self._err_check("conf_set_tx_level()", self, err)
         
     def conf_set_rx_level(self, slot, level):
         """Adjust the signal level to be received from the specified port
@@ -2464,7 +2683,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.conf_set_rx_level(slot, level)
-        self._err_check("conf_set_rx_level()", self, err)
+        if err:
+            self._err_check("conf_set_rx_level()", self, err)
         
     def conf_get_signal_level(self, slot):
         """Get last signal level transmitted to or received from the 
@@ -2480,13 +2700,32 @@ class Lib:
         """
         lck = self.auto_lock()
         err, tx_level, rx_level = _pjsua.conf_get_signal_level(slot)
-        self._err_check("conf_get_signal_level()", self, err)
+        if err:
+            self._err_check("conf_get_signal_level()", self, err)
         return (tx_level, rx_level)
         
 
 
     # Codecs API
 
+    def iter_codecs(self):
+        """Iterate over the codecs supported by pjsua.
+
+        Codec parameters are fetched as the iteration advances, so a
+        caller that stops at the codec it is looking for skips the
+        parameter queries for the rest.
+        """
+        lck = self.auto_lock()
+        ci_list = _pjsua.enum_codecs()
+        codec_get_param = _pjsua.codec_get_param
+        del lck
+        for ci in ci_list:
+            lck = self.auto_lock()
+            cp = codec_get_param(ci.codec_id)
+            del lck
+            if cp:
+                yield CodecInfo(ci, cp)
+
     def enum_codecs(self):
         """Return list of codecs supported by pjsua.
 
@@ -2494,14 +2733,7 @@ class Lib:
             list of CodecInfo
 
         """
-        lck = self.auto_lock()
-        ci_list = _pjsua.enum_codecs()
-        codec_info = []
-        for ci in ci_list:
-            cp = _pjsua.codec_get_param(ci.codec_id)
-            if cp:
-                codec_info.append(CodecInfo(ci, cp))
-        return codec_info
+        return list(self.iter_codecs())
 
     def set_codec_priority(self, name, priority):
         """Change the codec priority.
@@ -2513,7 +2745,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.codec_set_priority(name, priority)
-        self._err_check("set_codec_priority()", self, err)
+        if err:
+            self._err_check("set_codec_priority()", self, err)
 
     def get_codec_parameter(self, name):
         """Get codec parameter for the specified codec.
@@ -2539,7 +2772,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.codec_set_param(name, param._cvt_to_pjsua())
-        self._err_check("set_codec_parameter()", self, err)
+        if err:
+            self._err_check("set_codec_parameter()", self, err)
     
     # WAV playback and recording
 
@@ -2555,11 +2789,10 @@ class Lib:
 
         """
         lck = self.auto_lock()
-        opt = 0
-        if not loop:
-            opt = opt + 1
+        opt = 0 if loop else 1
         err, player_id = _pjsua.player_create(filename, opt)
-        self._err_check("create_player()", self, err)
+        if err:
+            self._err_check("create_player()", self, err)
         return player_id
         
     def player_get_slot(self, player_id):
@@ -2589,7 +2822,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.player_set_pos(player_id, pos)
-        self._err_check("player_set_pos()", self, err)
+        if err:
+            self._err_check("player_set_pos()", self, err)
         
     def player_destroy(self, player_id):
         """Destroy the WAV player.
@@ -2600,7 +2834,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.player_destroy(player_id)
-        self._err_check("player_destroy()", self, err)
+        if err:
+            self._err_check("player_destroy()", self, err)
 
     def create_playlist(self, filelist, label="playlist", loop=True):
         """Create WAV playlist.
@@ -2616,11 +2851,10 @@ class Lib:
             playlist_id
         """
         lck = self.auto_lock()
-        opt = 0
-        if not loop:
-            opt = opt + 1
+        opt = 0 if loop else 1
         err, playlist_id = _pjsua.playlist_create(label, filelist, opt)
-        self._err_check("create_playlist()", self, err)
+        if err:
+            self._err_check("create_playlist()", self, err)
         return playlist_id 
 
     def playlist_get_slot(self, playlist_id):
@@ -2649,7 +2883,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.player_destroy(playlist_id)
-        self._err_check("playlist_destroy()", self, err)
+        if err:
+            self._err_check("playlist_destroy()", self, err)
 
     def create_recorder(self, filename):
         """Create WAV file recorder.
@@ -2663,7 +2898,8 @@ class Lib:
         """
         lck = self.auto_lock()
         err, rec_id = _pjsua.recorder_create(filename, 0, None, -1, 0)
-        self._err_check("create_recorder()", self, err)
+        if err:
+            self._err_check("create_recorder()", self, err)
         return rec_id
         
     def recorder_get_slot(self, rec_id):
@@ -2692,26 +2928,24 @@ class Lib:
         """
         lck = self.auto_lock()
         err = _pjsua.recorder_destroy(rec_id)
-        self._err_check("recorder_destroy()", self, err)
+        if err:
+            self._err_check("recorder_destroy()", self, err)
 
 
     # Internal functions
 
     @staticmethod
     def strerror(err):
-        return _pjsua.strerror(err)
+        msg = _STRERROR_CACHE.get(err)
+        if msg is None:
+            msg = _STRERROR_CACHE[err] = _pjsua.strerror(err)
+        return msg
     
-    def _err_check(self, op_name, obj, err_code, err_msg=""):
+    def _err_check(self, op_name, obj, err_code, err_msg=None):
         if err_code != 0:
             raise Error(op_name, obj, err_code, err_msg)
 
-    @staticmethod
-    def _create_msg_data(hdr_list):
-        if not hdr_list:
-            return None
-        msg_data = _pjsua.Msg_Data()
-        msg_data.hdr_list = hdr_list
-        return msg_data
+    _create_msg_data = staticmethod(_create_msg_data)
     
     def auto_lock(self):
         return _LibMutex(self._lock)
@@ -2728,11 +2962,11 @@ class Lib:
         if buddy_id != -1:
             buddy = _pjsua.buddy_get_user_data(buddy_id)
         elif uri:
-            buddy_id = _pjsua.buddy_find(uri)
-            if buddy_id != -1:
-                buddy = _pjsua.buddy_get_user_data(buddy_id)
-            else:
-                buddy = None
+            buddy = self._buddy_by_uri.get(uri)
+            if buddy is None:
+                buddy_id = _pjsua.buddy_find(uri)
+                if buddy_id != -1:
+                    buddy = _pjsua.buddy_get_user_data(buddy_id)
         else:
             buddy = None
             
@@ -2742,7 +2976,7 @@ class Lib:
 
     def _cb_on_reg_state(self, acc_id):
         acc = self._lookup_account(acc_id)
-        if acc:
+        if acc and 'on_reg_state' in acc._cb_names:
             acc._cb.on_reg_state()
 
     def _cb_on_incoming_subscribe(self, acc_id, buddy_id, from_uri, 
@@ -2767,13 +3001,14 @@ class Lib:
 
     # Call callbacks 
 
-    def _cb_on_call_state(self, call_id):
+    def _cb_on_call_state(self, call_id, e=None):
         call = self._lookup_call(call_id)
         if call:
             if call._id == -1:
                 call.attach_to_id(call_id)
-            done = (call.info().state == CallState.DISCONNECTED)
-            call._cb.on_state()
+            done = (call.info().state == _CALL_STATE_DISCONNECTED)
+            if 'on_state' in call._cb_names:
+                call._cb.on_state()
             if done:
                 _pjsua.call_set_user_data(call_id, 0)
         else:
@@ -2781,12 +3016,12 @@ class Lib:
 
     def _cb_on_call_media_state(self, call_id):
         call = self._lookup_call(call_id)
-        if call:
+        if call and 'on_media_state' in call._cb_names:
             call._cb.on_media_state()
 
     def _cb_on_dtmf_digit(self, call_id, digits):
         call = self._lookup_call(call_id)
-        if call:
+        if call and 'on_dtmf_digit' in call._cb_names:
             call._cb.on_dtmf_digit(digits)
 
     def _cb_on_call_transfer_request(self, call_id, dst, code):
@@ -2816,112 +3051,63 @@ class Lib:
         if old_call and new_call:
             old_call._cb.on_replaced(new_call)
 
-    def _cb_on_pager(self, call_id, from_uri, to_uri, contact, mime_type, 
-                     body, acc_id):
-        call = None
+    def _route_im(self, call_id, peer_uri, acc_id):
+        # Shared routing for pager/pager-status/typing events: a call
+        # the message belongs to wins, then a buddy matching the peer
+        # URI, and the account is the fallback.
         if call_id != -1:
             call = self._lookup_call(call_id)
+            if call:
+                return call, None, None
+        return (None, self._lookup_buddy(-1, peer_uri),
+                self._lookup_account(acc_id))
+
+    def _cb_on_pager(self, call_id, from_uri, to_uri, contact, mime_type, 
+                     body, acc_id):
+        call, buddy, acc = self._route_im(call_id, from_uri, acc_id)
         if call:
-            call._cb.on_pager(mime_type, body)
-        else:
-            acc = self._lookup_account(acc_id)
-            buddy = self._lookup_buddy(-1, from_uri)
-            if buddy:
+            if 'on_pager' in call._cb_names:
+                call._cb.on_pager(mime_type, body)
+        elif buddy:
+            if 'on_pager' in buddy._cb_names:
                 buddy._cb.on_pager(mime_type, body)
-            else:
-                acc._cb.on_pager(from_uri, contact, mime_type, body)
+        elif acc and 'on_pager' in acc._cb_names:
+            acc._cb.on_pager(from_uri, contact, mime_type, body)
 
     def _cb_on_pager_status(self, call_id, to_uri, body, user_data, 
                             code, reason, acc_id):
-        call = None
-        if call_id != -1:
-            call = self._lookup_call(call_id)
+        call, buddy, acc = self._route_im(call_id, to_uri, acc_id)
         if call:
-            call._cb.on_pager_status(body, user_data, code, reason)
-        else:
-            acc = self._lookup_account(acc_id)
-            buddy = self._lookup_buddy(-1, to_uri)
-            if buddy:
+            if 'on_pager_status' in call._cb_names:
+                call._cb.on_pager_status(body, user_data, code, reason)
+        elif buddy:
+            if 'on_pager_status' in buddy._cb_names:
                 buddy._cb.on_pager_status(body, user_data, code, reason)
-            else:
-                acc._cb.on_pager_status(to_uri, body, user_data, code, reason)
+        elif acc and 'on_pager_status' in acc._cb_names:
+            acc._cb.on_pager_status(to_uri, body, user_data, code, reason)
 
     def _cb_on_typing(self, call_id, from_uri, to_uri, contact, is_typing, 
                       acc_id):
-        call = None
-        if call_id != -1:
-            call = self._lookup_call(call_id)
+        call, buddy, acc = self._route_im(call_id, from_uri, acc_id)
         if call:
-            call._cb.on_typing(is_typing)
-        else:
-            acc = self._lookup_account(acc_id)
-            buddy = self._lookup_buddy(-1, from_uri)
-            if buddy:
+            if 'on_typing' in call._cb_names:
+                call._cb.on_typing(is_typing)
+        elif buddy:
+            if 'on_typing' in buddy._cb_names:
                 buddy._cb.on_typing(is_typing)
-            else:
-                acc._cb.on_typing(from_uri, contact, is_typing)
+        elif acc and 'on_typing' in acc._cb_names:
+            acc._cb.on_typing(from_uri, contact, is_typing)
 
     def _cb_on_mwi_info(self, acc_id, body):
         acc = self._lookup_account(acc_id)
-        if acc:
+        if acc and 'on_mwi_info' in acc._cb_names:
             return acc._cb.on_mwi_info(body)
 
     def _cb_on_buddy_state(self, buddy_id):
         buddy = self._lookup_buddy(buddy_id)
-        if buddy:
+        if buddy and 'on_state' in buddy._cb_names:
             buddy._cb.on_state()
 
-#
-# Internal
-#
-
-def _cb_on_call_state(call_id, e):
-    _lib._cb_on_call_state(call_id)
-
-def _cb_on_incoming_call(acc_id, call_id, rdata):
-    _lib._cb_on_incoming_call(acc_id, call_id, rdata)
-
-def _cb_on_call_media_state(call_id):
-    _lib._cb_on_call_media_state(call_id)
-
-def _cb_on_dtmf_digit(call_id, digits):
-    _lib._cb_on_dtmf_digit(call_id, digits)
-
-def _cb_on_call_transfer_request(call_id, dst, code):
-    return _lib._cb_on_call_transfer_request(call_id, dst, code)
-
-def _cb_on_call_transfer_status(call_id, code, reason, final, cont):
-    return _lib._cb_on_call_transfer_status(call_id, code, reason, 
-                                             final, cont)
-def _cb_on_call_replace_request(call_id, rdata, code, reason):
-    return _lib._cb_on_call_replace_request(call_id, rdata, code, reason)
-
-def _cb_on_call_replaced(old_call_id, new_call_id):
-    _lib._cb_on_call_replaced(old_call_id, new_call_id)
-
-def _cb_on_reg_state(acc_id):
-    _lib._cb_on_reg_state(acc_id)
-
-def _cb_on_incoming_subscribe(acc_id, buddy_id, from_uri, contact_uri, pres):
-    return _lib._cb_on_incoming_subscribe(acc_id, buddy_id, from_uri, 
-                                          contact_uri, pres)
-
-def _cb_on_buddy_state(buddy_id):
-    _lib._cb_on_buddy_state(buddy_id)
-
-def _cb_on_pager(call_id, from_uri, to, contact, mime_type, body, acc_id):
-    _lib._cb_on_pager(call_id, from_uri, to, contact, mime_type, body, acc_id)
-
-def _cb_on_pager_status(call_id, to, body, user_data, status, reason, acc_id):
-    _lib._cb_on_pager_status(call_id, to, body, user_data, 
-                             status, reason, acc_id)
-
-def _cb_on_typing(call_id, from_uri, to, contact, is_typing, acc_id):
-    _lib._cb_on_typing(call_id, from_uri, to, contact, is_typing, acc_id)
-
-def _cb_on_mwi_info(acc_id, body):
-    _lib._cb_on_mwi_info(acc_id, body)
-
 # Worker thread
 def _worker_thread_main(arg):
     global _lib
@@ -2929,11 +3115,14 @@ def _worker_thread_main(arg):
     thread_desc = 0;
     err = _pjsua.thread_register("python worker", thread_desc)
     _lib._err_check("thread_register()", _lib, err)
-    while _lib and _lib._quit == 0:
-        _lib.handle_events(1)
-	time.sleep(0.050)
-    if _lib:
-        _lib._quit = 2
+    lib = _lib
+    handle_events = lib.handle_events
+    sleep = time.sleep
+    while lib._quit == 0:
+        handle_events(1)
+        sleep(lib._worker_sleep)
+    lib._quit = 2
+    lib._quit_event.set()
     _Trace(('worker thread exited..',))
 
 def _Trace(args):